@@ -1,9 +1,10 @@
 # Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
 
-from typing import Union
+from functools import partial
+from typing import Callable, Union
 
 import jax.numpy as jnp
-from jax import Array, custom_jvp
+from jax import Array, custom_jvp, grad, jit, jvp
 from jax.nn import sigmoid
 from jax.scipy.special import digamma, gamma, gammaln
 from jax.typing import ArrayLike
@@ -206,6 +207,7 @@ def gaussian_density(x: ArrayLike, mean: ArrayLike, precision: ArrayLike) -> Arr
     return precision / jnp.sqrt(2 * jnp.pi) * jnp.exp(-precision / 2 * (x - mean) ** 2)
 
 
+@partial(jit, static_argnames=("clipping",), inline=True)
 def binary_surprise(
     x: ArrayLike,
     expected_mean: ArrayLike,
@@ -226,7 +228,7 @@ def binary_surprise(
     Parameters
     ----------
     x :
-        The outcome.
+        The outcome. Any non-zero value is treated as :math:`x=1`.
     expected_mean :
         The mean of the Bernoulli distribution.
     clipping :
@@ -248,11 +250,12 @@ def binary_surprise(
     if clipping:
         expected_mean = jnp.clip(expected_mean, 1e-6, 1 - 1e-6)
 
-    return jnp.where(
-        x, -jnp.log(expected_mean), -jnp.log(jnp.array(1.0) - expected_mean)
-    )
+    # any non-zero outcome is treated as x=1, and log(1 - mu) is computed as
+    # log1p(-mu) for accuracy near mu=1
+    return jnp.where(x, -jnp.log(expected_mean), -jnp.log1p(-expected_mean))
 
 
+@partial(jit, inline=True)
 def gaussian_surprise(
     x: ArrayLike,
     expected_mean: ArrayLike,
@@ -368,10 +371,45 @@ def binary_surprise_finite_precision(
     surprise :
         The binary surprise under finite precision.
     """
-    return -jnp.log(
-        expected_mean * gaussian_density(value, eta1, expected_precision)
-        + (1 - expected_mean) * gaussian_density(value, eta0, expected_precision)
+    # log of the weighted Gaussian densities under eta1 and eta0, combined with a
+    # log-sum-exp instead of exponentiating and summing the two densities
+    log_normalisation = 0.5 * jnp.log(expected_precision / (2 * jnp.pi))
+    log_likelihood_1 = (
+        jnp.log(expected_mean) - expected_precision / 2 * (value - eta1) ** 2
     )
+    log_likelihood_0 = (
+        jnp.log1p(-expected_mean) - expected_precision / 2 * (value - eta0) ** 2
+    )
+
+    return -(log_normalisation + jnp.logaddexp(log_likelihood_1, log_likelihood_0))
+
+
+def first_and_second_derivatives(fn: Callable, x: ArrayLike) -> tuple[Array, Array]:
+    """First and second derivatives of a scalar function in a single pass.
+
+    The second derivative is obtained by forward-mode differentiation of the gradient,
+    so the gradient computed on the way is reused instead of being traced twice as in
+    ``grad(fn)(x), grad(grad(fn))(x)``.
+
+    Parameters
+    ----------
+    fn :
+        A scalar function (e.g. a coupling function).
+    x :
+        The point at which the derivatives are evaluated.
+
+    Returns
+    -------
+    first_derivative, second_derivative :
+        The first and second derivatives of `fn` evaluated at `x`.
+
+    Examples
+    --------
+    >>> from pyhgf.math import first_and_second_derivatives
+    >>> first_and_second_derivatives(jnp.tanh, 0.3)
+    `(Array(0.915137, dtype=float32, weak_type=True), Array(-0.53318185, dtype=float32, weak_type=True))`
+    """
+    return jvp(grad(fn), (x,), (jnp.ones_like(x),))
 
 
 def sigmoid_inverse_temperature(x: ArrayLike, temperature: ArrayLike) -> Array:
@@ -447,6 +485,50 @@ def smoothed_rectangular(
     )
 
 
+def gaussian_mixture_moments(
+    mean_1: ArrayLike,
+    precision_1: ArrayLike,
+    mean_2: ArrayLike,
+    precision_2: ArrayLike,
+    weight: ArrayLike,
+) -> tuple[Array, Array]:
+    r"""Match a two-component Gaussian mixture with a single Gaussian.
+
+    The mixture :math:`(1 - b)\mathcal{N}(\mu_1, \pi_1^{-1}) +
+    b\mathcal{N}(\mu_2, \pi_2^{-1})` is collapsed to its first two moments. The
+    variance is accumulated as :math:`(1 - b)/\pi_1 + b/\pi_2`, which stays
+    accurate in single precision when the two precisions are far apart, unlike
+    the algebraically equal :math:`1/\pi_1 + b(1/\pi_2 - 1/\pi_1)`.
+
+    Parameters
+    ----------
+    mean_1 :
+        The mean :math:`\mu_1` of the first component.
+    precision_1 :
+        The precision :math:`\pi_1` of the first component.
+    mean_2 :
+        The mean :math:`\mu_2` of the second component.
+    precision_2 :
+        The precision :math:`\pi_2` of the second component.
+    weight :
+        The weight :math:`b` of the second component.
+
+    Returns
+    -------
+    mean, precision :
+        The mean and precision of the moment-matched Gaussian.
+    """
+    # the mean is an interpolation from component 1 towards component 2
+    delta_mean = mean_2 - mean_1
+    mean = mean_1 + weight * delta_mean
+    variance = (
+        (1.0 - weight) / precision_1
+        + weight / precision_2
+        + weight * (1.0 - weight) * delta_mean**2
+    )
+    return mean, 1.0 / variance
+
+
 @custom_jvp
 def lambert_w0(z: ArrayLike) -> Array:
     r"""Principal branch of the Lambert W function for z >= 0.
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import partial
 from typing import Callable, Optional, Union
 
 import jax.numpy as jnp
 import numpy as np
 import pandas as pd
-from jax import Array, random, vmap
+from jax import Array, jit, random, vmap
 from jax.lax import scan, switch
 from jax.tree_util import Partial
 from jax.typing import ArrayLike
@@ -44,6 +46,152 @@ from pyhgf.utils import (
 )
 
 
+@partial(jit, static_argnames=("scan_fn", "record_trajectories"))
+def _scan_inputs(
+    scan_fn: Callable,
+    attributes: Attributes,
+    inputs: tuple,
+    record_trajectories: bool = True,
+) -> tuple[Attributes, Optional[Attributes]]:
+    """Loop the propagation function over the whole input time series.
+
+    The scan is compiled once per propagation function, recording mode and input
+    shapes, so repeated calls on the same network reuse the compiled graph.
+
+    Parameters
+    ----------
+    scan_fn :
+        The propagation function (e.g. :py:attr:`Network.scan_fn`), passed as a static
+        argument so it is hashed by identity.
+    attributes :
+        The attributes of the probabilistic nodes at the start of the time series.
+    inputs :
+        The inputs scanned over, as expected by `scan_fn`.
+    record_trajectories :
+        If `True` (default), return the node trajectories at every time step.
+        Otherwise, only return the final attributes.
+
+    Returns
+    -------
+    last_attributes, node_trajectories :
+        The attributes after the last time step and the node trajectories (`None` if
+        `record_trajectories` is `False`).
+    """
+    if record_trajectories:
+        return scan(scan_fn, attributes, inputs)
+
+    def _no_traj_step(attributes, inputs):
+        new_attributes, _ = scan_fn(attributes, inputs)
+        return new_attributes, None
+
+    last_attributes, _ = scan(_no_traj_step, attributes, inputs)
+
+    return last_attributes, None
+
+
+# propagation functions shared by networks with the same topology, so that the
+# compiled scan in `_scan_inputs` is reused across instances. The cache is bounded
+# (least recently used entries are dropped) so that processes building many
+# networks, e.g. inside a sampling loop, do not keep every topology alive
+_BELIEF_PROPAGATION_FN_CACHE: OrderedDict = OrderedDict()
+_BELIEF_PROPAGATION_FN_CACHE_SIZE = 128
+
+
+def _typed_key(value):
+    """Hashable key of a parameter value that also distinguishes its type.
+
+    Values such as `1`, `1.0` and `True` compare (and hash) equal, but they can lead to
+    different update functions, so the type is part of the key.
+    """
+    if isinstance(value, tuple):
+        return (tuple, tuple(_typed_key(v) for v in value))
+    return (type(value), value)
+
+
+def _step_key(update_fn: Callable):
+    """Hashable key of an update step, comparing partials by their content."""
+    if isinstance(update_fn, partial):
+        return (
+            update_fn.func,
+            _typed_key(update_fn.args),
+            tuple((k, _typed_key(v)) for k, v in sorted(update_fn.keywords.items())),
+        )
+    return update_fn
+
+
+def _sequence_key(sequence: tuple) -> tuple:
+    """Hashable key of a sequence of update steps (see :py:func:`_step_key`)."""
+    return tuple(
+        None if steps is None else tuple((i, _step_key(fn)) for i, fn in steps)
+        for steps in sequence
+    )
+
+
+def _get_cached_fn(key: tuple, fn: Partial) -> Partial:
+    """Return the propagation function stored under `key`, or store `fn` there."""
+    try:
+        cached_fn = _BELIEF_PROPAGATION_FN_CACHE.get(key)
+    except TypeError:
+        # custom update steps with unhashable parameters are not shared
+        return fn
+
+    if cached_fn is not None:
+        _BELIEF_PROPAGATION_FN_CACHE.move_to_end(key)
+        return cached_fn
+
+    _BELIEF_PROPAGATION_FN_CACHE[key] = fn
+    while len(_BELIEF_PROPAGATION_FN_CACHE) > _BELIEF_PROPAGATION_FN_CACHE_SIZE:
+        _BELIEF_PROPAGATION_FN_CACHE.popitem(last=False)
+    return fn
+
+
+def _get_belief_propagation_fn(
+    update_sequence: UpdateSequence,
+    edges: Edges,
+    input_idxs: tuple[int, ...],
+    observations: str = "external",
+) -> Partial:
+    """Return the belief propagation function for a network topology.
+
+    Networks with identical edges, input nodes and update steps receive the same
+    function object, so the scan compiled for one of them is reused by the others.
+
+    Parameters
+    ----------
+    update_sequence :
+        The sequence of updates that will be applied to the node structure.
+    edges :
+        The edges of the probabilistic nodes.
+    input_idxs :
+        The indexes of the input nodes.
+    observations :
+        How the network receives new observations (see
+        :py:func:`pyhgf.utils.beliefs_propagation`).
+
+    Returns
+    -------
+    scan_fn :
+        The parametrized version of :py:func:`pyhgf.utils.beliefs_propagation`.
+    """
+    scan_fn = Partial(
+        beliefs_propagation,
+        update_sequence=update_sequence,
+        edges=edges,
+        input_idxs=input_idxs,
+        observations=observations,
+    )
+    return _get_cached_fn(
+        (
+            beliefs_propagation,
+            _sequence_key(update_sequence),
+            edges,
+            input_idxs,
+            observations,
+        ),
+        scan_fn,
+    )
+
+
 class Network:
     """A predictive coding neural network.
 
@@ -214,8 +362,7 @@ class Network:
         # create the belief propagation function
         # this function is used by scan to loop over observations
         if (self.scan_fn is None) or overwrite:
-            self.scan_fn = Partial(
-                beliefs_propagation,
+            self.scan_fn = _get_belief_propagation_fn(
                 update_sequence=self.update_sequence,
                 edges=self.edges,
                 input_idxs=self.input_idxs,
@@ -223,8 +370,7 @@ class Network:
 
         # Create the generative scan function if it doesn't exist, and if requested.
         if (self.scan_fn_sample is None) and sampling_fn:
-            self.sample_scan_fn = Partial(
-                beliefs_propagation,
+            self.sample_scan_fn = _get_belief_propagation_fn(
                 update_sequence=self.update_sequence,
                 edges=self.edges,
                 input_idxs=self.input_idxs,
@@ -359,14 +505,26 @@ class Network:
 
         # create the learning propagation function
         # this function is used by scan to loop over predictors (x) and predictions (y)
+        # networks with the same structure and learning parameters share this function,
+        # so repeated calls to `fit` reuse the compiled scan
         if (self.scan_fn is None) or overwrite:
-            self.scan_fn = Partial(
-                learning,
-                learning_sequence=self.learning_sequence,
-                edges=self.edges,
-                inputs_x_idxs=inputs_x_idxs,
-                inputs_y_idxs=inputs_y_idxs,
-                use_adam=use_adam,
+            self.scan_fn = _get_cached_fn(
+                (
+                    learning,
+                    _sequence_key(self.learning_sequence),
+                    self.edges,
+                    inputs_x_idxs,
+                    inputs_y_idxs,
+                    use_adam,
+                ),
+                Partial(
+                    learning,
+                    learning_sequence=self.learning_sequence,
+                    edges=self.edges,
+                    inputs_x_idxs=inputs_x_idxs,
+                    inputs_y_idxs=inputs_y_idxs,
+                    use_adam=use_adam,
+                ),
             )
 
         return self
@@ -438,19 +596,13 @@ class Network:
         # this is where the model loops over the whole input time series
         # at each time point, the node structure is traversed and beliefs are updated
         # using precision-weighted prediction errors
-        if record_trajectories:
-            last_attributes, node_trajectories = scan(
-                self.scan_fn, self.attributes, inputs
-            )
-            self.node_trajectories = node_trajectories
-        else:
-
-            def _no_traj_step(attributes, inputs):
-                new_attributes, _ = self.scan_fn(attributes, inputs)
-                return new_attributes, None
-
-            last_attributes, _ = scan(_no_traj_step, self.attributes, inputs)
-            self.node_trajectories = None  # type: ignore[assignment]
+        last_attributes, node_trajectories = _scan_inputs(
+            self.scan_fn,
+            self.attributes,
+            inputs,
+            record_trajectories=record_trajectories,
+        )
+        self.node_trajectories = node_trajectories  # type: ignore[assignment]
 
         self.last_attributes = last_attributes
 
@@ -609,19 +761,13 @@ class Network:
         # this is where the model loops over the whole input time series
         # at each time point, the node structure is traversed and beliefs are updated
         # using precision-weighted prediction errors
-        if record_trajectories:
-            last_attributes, node_trajectories = scan(
-                self.scan_fn, self.attributes, inputs
-            )
-            self.node_trajectories = node_trajectories
-        else:
-
-            def _no_traj_step(attributes, inputs):
-                new_attributes, _ = self.scan_fn(attributes, inputs)
-                return new_attributes, None
-
-            last_attributes, _ = scan(_no_traj_step, self.attributes, inputs)
-            self.node_trajectories = None  # type: ignore[assignment]
+        last_attributes, node_trajectories = _scan_inputs(
+            self.scan_fn,
+            self.attributes,
+            inputs,
+            record_trajectories=record_trajectories,
+        )
+        self.node_trajectories = node_trajectories  # type: ignore[assignment]
 
         self.last_attributes = last_attributes
 
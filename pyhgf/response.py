@@ -83,10 +83,9 @@ def total_gaussian_surprise(
                 expected_precision=hgf.node_trajectories[i]["expected_precision"],
             )
 
-    # Return an infinite surprise if the model could not fit at any point
-    return jnp.where(
-        jnp.any(jnp.isnan(hgf.node_trajectories[1]["mean"])), jnp.inf, surprise
-    )
+    # Return an infinite surprise at the time points where the model could not fit,
+    # masking the summed surprise directly in a single pass
+    return jnp.where(jnp.isnan(surprise), jnp.inf, surprise)
 
 
 def first_level_binary_surprise(
@@ -197,14 +196,12 @@ def binary_softmax_inverse_temperature(
         The surprise under the binary softmax model.
 
     """
-    # the expected values at the first level of the HGF
-    beliefs = (
-        hgf.node_trajectories[0]["expected_mean"] ** response_function_parameters
-    ) / (
-        hgf.node_trajectories[0]["expected_mean"] ** response_function_parameters
-        + (1 - hgf.node_trajectories[0]["expected_mean"])
-        ** response_function_parameters
-    )
+    # the expected values at the first level of the HGF, raised to the inverse
+    # temperature once and reused in both the numerator and the normalisation
+    expected_mean = hgf.node_trajectories[0]["expected_mean"]
+    weighted_a = expected_mean**response_function_parameters
+    weighted_b = (1 - expected_mean) ** response_function_parameters
+    beliefs = weighted_a / (weighted_a + weighted_b)
 
     # the binary surprises
     surprise = binary_surprise(x=response_function_inputs, expected_mean=beliefs)
@@ -4,11 +4,11 @@ from functools import partial
 from typing import Optional
 
 import jax.numpy as jnp
-from jax import jit
+from jax import jit, vmap
 from jax.nn import sigmoid as jax_sigmoid
 
 from pyhgf.typing import Attributes, Edges
-from pyhgf.utils import set_coupling
+from pyhgf.utils.set_coupling import _set_couplings
 
 
 @partial(jit, static_argnames=("node_idx", "edges", "kind"))
@@ -70,10 +70,10 @@ def learning_weights(
 
     """
     # 1. get the prospective activation vector from the upper layer with coupling
-    means = [
+    means = jnp.array([
         attributes[parent_idx]["mean"]
         for parent_idx in edges[node_idx].value_parents  # type: ignore[union-attr]
-    ]
+    ])
     couplings = attributes[node_idx]["value_coupling_parents"]
 
     child_precision = attributes[node_idx].get("precision", 1.0)
@@ -92,9 +92,17 @@ def learning_weights(
         ]
 
     # 3. prospective activation for each parent
-    prospective_activation = jnp.array([
-        fn(mean) if fn is not None else mean for mean, fn in zip(means, coupling_fns)
-    ])
+    # when every parent shares the same coupling function (the common case), apply it
+    # once to the whole vector of means instead of once per parent
+    if all(fn is coupling_fns[0] for fn in coupling_fns):
+        prospective_activation = (
+            vmap(coupling_fns[0])(means) if coupling_fns[0] is not None else means
+        )
+    else:
+        prospective_activation = jnp.array([
+            fn(mean) if fn is not None else mean
+            for mean, fn in zip(means, coupling_fns)
+        ])
 
     # 4. compute the gradient according to *kind*
     pe = attributes[node_idx]["mean"] - attributes[node_idx]["expected_mean"]
@@ -131,16 +139,12 @@ def learning_weights(
         new_value_couplings,
     )
 
-    for value_parent_idx, new_value_coupling in zip(
-        edges[node_idx].value_parents,  # type: ignore[arg-type]
-        new_value_couplings,
-    ):
-        attributes = set_coupling(
-            parent_idx=value_parent_idx,
-            child_idx=node_idx,
-            coupling=new_value_coupling,
-            edges=edges,
-            attributes=attributes,
-        )
+    # write the whole row of couplings at once and mirror it in the parent nodes
+    attributes = _set_couplings(
+        attributes=attributes,
+        edges=edges,
+        child_idx=node_idx,
+        couplings=new_value_couplings,
+    )
 
     return attributes
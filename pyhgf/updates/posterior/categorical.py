@@ -61,12 +61,14 @@ def categorical_state_update(
     delta_xi = updated_mean - expected_mean
 
     # using the new PE, we can update nu and the alpha vector
-    nu = (pe / delta_xi) - 1
+    # the ratio is undefined when the parents did not move (e.g. at the first time
+    # step), in which case alpha falls back to 1. The divisor is masked before the
+    # division (double where) so neither the values nor the gradients become NaN
+    no_update = delta_xi == 0.0
+    safe_delta_xi = jnp.where(no_update, 1.0, delta_xi)
+    nu = jnp.where(no_update, 0.0, (pe / safe_delta_xi) - 1)
     alpha = (nu * expected_mean) + 1  # concentration parameters for the Dirichlet
 
-    # in case alpha contains NaNs
-    # alpha = jnp.where(jnp.isnan(alpha), 1.0, alpha)
-
     # compute Bayesian surprise as :
     # 1 - KL divergence from the concentration parameters
     attributes[node_idx]["kl_divergence"] = dirichlet_kullback_leibler(
@@ -6,7 +6,7 @@ import jax.numpy as jnp
 from jax import jit
 from jax.nn import sigmoid
 
-from pyhgf.math import lambert_w0
+from pyhgf.math import gaussian_mixture_moments, lambert_w0
 from pyhgf.typing import Edges
 
 
@@ -96,8 +96,12 @@ def posterior_update_unbounded(
     log_time_step = jnp.log(time_step)
     log_previous_variance = jnp.log(previous_variance)
 
+    # Subexpressions shared by both expansions and the energy blend below
+    log_offset = log_time_step + tonic_volatility
+    volatility_coupling_sq = volatility_coupling**2
+
     # Canonical exponent at prediction: γ = log(time_step) + volatility_coupling*expected_mean + tonic_volatility
-    gamma_c = log_time_step + volatility_coupling * expected_mean + tonic_volatility
+    gamma_c = log_offset + volatility_coupling * expected_mean
 
     # w_jm1 = 1/(1 + previous_variance/exp(γ)) = sigmoid(γ − log α). Matches the original
     # ``1/(1 + previous_variance/v_jm1)`` exactly for every finite γ, and stays
@@ -112,13 +116,13 @@ def posterior_update_unbounded(
     # ----------------------------------------------------------------------------------
     # Expansion 1: quadratic at the prediction (prior mean)
     # ----------------------------------------------------------------------------------
-    pi1 = expected_precision + 0.5 * volatility_coupling**2 * w_jm1 * (1.0 - w_jm1)
+    pi1 = expected_precision + 0.5 * volatility_coupling_sq * w_jm1 * (1.0 - w_jm1)
     mu1 = expected_mean + (volatility_coupling * w_jm1 / (2.0 * pi1)) * da_jm1
 
     # ----------------------------------------------------------------------------------
     # Expansion 2: quadratic at the Lambert W0 approximate mode
     # ----------------------------------------------------------------------------------
-    pihat_y = expected_precision / volatility_coupling**2
+    pihat_y = expected_precision / volatility_coupling_sq
 
     # Compute W_arg in log-space and cap at log(float_max) — matches MATLAB's
     # "W_arg = exp(min(log_W_arg, log(realmax)))".
@@ -127,27 +131,28 @@ def posterior_update_unbounded(
     W_arg = jnp.exp(jnp.minimum(log_W_arg, log_float_max))
     v_W = lambert_w0(W_arg)
     y_star = gamma_c + v_W - 0.5 / pihat_y
-    x_star = (y_star - log_time_step - tonic_volatility) / volatility_coupling
+    x_star = (y_star - log_offset) / volatility_coupling
 
     # Log-space form of s2, w2, da2 — equivalent to the original
     #   s2 = time_step * exp(volatility_coupling*x_star + tonic_volatility)
     #   w2 = 1 / (1 + previous_variance / s2)
     #   da2 = be_aux / (previous_variance + s2) - 1
     # but without ever materialising ``s2 = inf`` in the forward pass, which
-    # would inject NaN gradients via 0·∞.
-    log_s2 = log_time_step + volatility_coupling * x_star + tonic_volatility
+    # would inject NaN gradients via 0·∞. By construction of x_star, the exponent
+    # log(s2) is y_star itself.
+    log_s2 = y_star
     log_denom_s = jnp.logaddexp(
         log_previous_variance, log_s2
     )  # = log(previous_variance + s2)
     w2 = sigmoid(log_s2 - log_previous_variance)
     da2 = be_aux * jnp.exp(-log_denom_s) - 1.0
 
-    pi2_full = expected_precision + 0.5 * volatility_coupling**2 * w2 * (
+    pi2_full = expected_precision + 0.5 * volatility_coupling_sq * w2 * (
         w2 + (2.0 * w2 - 1.0) * da2
     )
     pi2_safe = jnp.where(
         pi2_full <= 0.0,
-        expected_precision + 0.5 * volatility_coupling**2 * w2 * (1.0 - w2),
+        expected_precision + 0.5 * volatility_coupling_sq * w2 * (1.0 - w2),
         pi2_full,
     )
     mu2_safe = (
@@ -189,7 +194,7 @@ def posterior_update_unbounded(
     # ``logaddexp`` and ``exp(-positive)`` are both bounded forward and
     # backward.
     # ----------------------------------------------------------------------------------
-    log_ey1 = log_time_step + volatility_coupling * mu1 + tonic_volatility
+    log_ey1 = log_offset + volatility_coupling * mu1
     log_denom_1 = jnp.logaddexp(
         log_previous_variance, log_ey1
     )  # = log(previous_variance + ey1)
@@ -199,7 +204,7 @@ def posterior_update_unbounded(
         - 0.5 * expected_precision * (mu1 - expected_mean) ** 2
     )
 
-    log_ey2 = log_time_step + volatility_coupling * mu2 + tonic_volatility
+    log_ey2 = log_offset + volatility_coupling * mu2
     log_denom_2 = jnp.logaddexp(log_previous_variance, log_ey2)
     I2 = (
         -0.5 * log_denom_2
@@ -213,8 +218,8 @@ def posterior_update_unbounded(
     # ----------------------------------------------------------------------------------
     # Gaussian mixture moment matching
     # ----------------------------------------------------------------------------------
-    posterior_mean = (1.0 - b) * mu1 + b * mu2
-    sig2 = (1.0 - b) / pi1 + b / pi2 + b * (1.0 - b) * (mu1 - mu2) ** 2
-    posterior_precision = 1.0 / sig2
+    posterior_mean, posterior_precision = gaussian_mixture_moments(
+        mu1, pi1, mu2, pi2, b
+    )
 
     return posterior_precision, posterior_mean
@@ -4,10 +4,11 @@ from functools import partial
 from typing import Callable
 
 import jax.numpy as jnp
-from jax import Array, grad, jit
+from jax import Array, jit
 from jax.lax import cond
 from jax.tree_util import Partial
 
+from pyhgf.math import first_and_second_derivatives
 from pyhgf.typing import Edges
 
 # ----------------------------------------------------------------------------------
@@ -113,16 +114,15 @@ def _value_coupling_pwpe(
             coupling_fn_prime = value_coupling**2
             coupling_fn_second = 0
         else:  # non-linear coupling
-            coupling_fn_prime = (
-                value_coupling**2 * grad(coupling_fn)(attributes[node_idx]["mean"]) ** 2
+            first_derivative, second_derivative = first_and_second_derivatives(
+                coupling_fn, attributes[node_idx]["mean"]
             )
+            coupling_fn_prime = value_coupling**2 * first_derivative**2
             value_prediction_error = attributes[value_child_idx]["temp"][
                 "value_prediction_error"
             ]
             coupling_fn_second = (
-                value_coupling
-                * grad(grad(coupling_fn))(attributes[node_idx]["mean"])
-                * value_prediction_error
+                value_coupling * second_derivative * value_prediction_error
             )
 
         effective_child_precision = effective_precision_fn(
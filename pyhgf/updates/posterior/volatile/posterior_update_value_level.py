@@ -5,6 +5,7 @@ from functools import partial
 
 from jax import grad, jit
 
+from pyhgf.math import first_and_second_derivatives
 from pyhgf.typing import Edges
 
 
@@ -117,11 +118,8 @@ def posterior_update_precision_value_level(
                 posterior_precision += (value_coupling**2) * effective_child_precision
             else:
                 # Non-linear coupling (with gradient)
-                coupling_fn_prime = grad(coupling_fn)(
-                    attributes[node_idx]["expected_mean"]
-                )
-                coupling_fn_second = grad(grad(coupling_fn))(
-                    attributes[node_idx]["expected_mean"]
+                coupling_fn_prime, coupling_fn_second = first_and_second_derivatives(
+                    coupling_fn, attributes[node_idx]["expected_mean"]
                 )
                 value_pe = attributes[value_child_idx]["temp"]["value_prediction_error"]
 
@@ -292,11 +290,8 @@ def posterior_update_precision_value_level_mean_field(
             if coupling_fn is None:
                 posterior_precision += (value_coupling**2) * child_expected_precision
             else:
-                coupling_fn_prime = grad(coupling_fn)(
-                    attributes[node_idx]["expected_mean"]
-                )
-                coupling_fn_second = grad(grad(coupling_fn))(
-                    attributes[node_idx]["expected_mean"]
+                coupling_fn_prime, coupling_fn_second = first_and_second_derivatives(
+                    coupling_fn, attributes[node_idx]["expected_mean"]
                 )
                 value_pe = attributes[value_child_idx]["temp"]["value_prediction_error"]
 
@@ -6,7 +6,7 @@ import jax.numpy as jnp
 from jax import jit
 from jax.nn import sigmoid
 
-from pyhgf.math import lambert_w0
+from pyhgf.math import gaussian_mixture_moments, lambert_w0
 
 
 @partial(jit, static_argnames=("node_idx", "max_posterior_precision"))
@@ -102,7 +102,8 @@ def volatile_node_posterior_update_unbounded(
     #   s2 = time_step * exp(x_star); w2 = 1/(1 + previous_variance/s2);
     #   da2 = be_aux/(previous_variance + s2) - 1
     # but without materialising ``s2 = inf`` (which injects 0·∞ NaN gradients).
-    log_s2 = log_time_step + x_star
+    # By construction of x_star, the exponent log(s2) is y_star itself.
+    log_s2 = y_star
     log_denom_s = jnp.logaddexp(
         log_previous_variance, log_s2
     )  # = log(previous_variance + s2)
@@ -166,9 +167,9 @@ def volatile_node_posterior_update_unbounded(
     # ----------------------------------------------------------------------------------
     # Gaussian mixture moment matching
     # ----------------------------------------------------------------------------------
-    posterior_mean = (1.0 - b) * mu1 + b * mu2
-    sig2 = (1.0 - b) / pi1 + b / pi2 + b * (1.0 - b) * (mu1 - mu2) ** 2
-    posterior_precision = 1.0 / sig2
+    posterior_mean, posterior_precision = gaussian_mixture_moments(
+        mu1, pi1, mu2, pi2, b
+    )
 
     attributes[node_idx]["precision_vol"] = jnp.minimum(
         posterior_precision, max_posterior_precision
@@ -63,10 +63,14 @@ def binary_state_node_prediction(
         The attributes of the probabilistic nodes.
 
     """
-    # List the (unique) value parent of the binary state node
-    expected_mean = 0.0
-    for value_parent_idx in edges[node_idx].value_parents:  # type: ignore
-        expected_mean += attributes[value_parent_idx]["expected_mean"]
+    # Gather the expected means of the value parents once and reduce them in a single
+    # vectorized sum instead of unrolling one traced addition per parent
+    expected_mean = jnp.sum(
+        jnp.array([
+            attributes[value_parent_idx]["expected_mean"]
+            for value_parent_idx in edges[node_idx].value_parents  # type: ignore
+        ])
+    )
 
     # Estimate the new expected mean using the sigmoid transform
     # eq. 80 in Weber et al., v2
@@ -78,10 +78,10 @@ def predict_mean(
     # Look at the (optional) value parents for this node
     # and update the drift rate accordingly
     if value_parents_idxs is not None:
-        for value_parent_idx, psi in zip(
-            value_parents_idxs,
-            attributes[node_idx]["value_coupling_parents"],
-        ):
+        # gather the (coupled) expected mean of each value parent, then reduce them
+        # against the coupling strengths in a single dot product
+        parent_values = []
+        for value_parent_idx in value_parents_idxs:
             # look at each value parent
             # and get the coupling function to compute the drift
             child_position = edges[value_parent_idx].value_children.index(node_idx)
@@ -92,8 +92,11 @@ def predict_mean(
                 parent_value = coupling_fn(
                     attributes[value_parent_idx]["expected_mean"]
                 )
+            parent_values.append(parent_value)
 
-            driftrate += psi * parent_value
+        driftrate += jnp.dot(
+            attributes[node_idx]["value_coupling_parents"], jnp.array(parent_values)
+        )
 
     # The new expected mean from the previous value
     expected_mean = (
@@ -224,11 +227,10 @@ def predict_precision(
                 2.0 * attributes[volatility_parents_idx]["expected_precision"]
             )
 
-    # compute the predicted_volatility from the total volatility
+    # compute the predicted_volatility from the total volatility. An underflow to zero
+    # (very low volatility or a zero time step) leaves the precision unchanged below,
+    # so no guard is required
     predicted_volatility = time_step * jnp.exp(total_volatility)
-    predicted_volatility = jnp.where(
-        predicted_volatility > 1e-128, predicted_volatility, jnp.nan
-    )
 
     # piHGF Laplace value-coupling correction. The conditional mean of x_a is
     # linearised around μ̂_b via a first-order Taylor expansion of the coupling
@@ -443,9 +445,6 @@ def predict_precision_mean_field(
             )
 
     predicted_volatility = time_step * jnp.exp(total_volatility)
-    predicted_volatility = jnp.where(
-        predicted_volatility > 1e-128, predicted_volatility, jnp.nan
-    )
 
     expected_precision = 1 / (
         (1 / attributes[node_idx]["precision"]) + predicted_volatility
@@ -35,9 +35,6 @@ def predict_precision_volatility_level(
 
     # Compute predicted volatility for the volatility level
     predicted_volatility_vol = time_step * jnp.exp(tonic_volatility_vol)
-    predicted_volatility_vol = jnp.where(
-        predicted_volatility_vol > 1e-128, predicted_volatility_vol, jnp.nan
-    )
 
     # Expected precision
     expected_precision_vol = 1 / ((1 / precision_vol) + predicted_volatility_vol)
@@ -84,10 +81,10 @@ def predict_mean_value_level(
 
     # Look at the (optional) value parents for this node
     if value_parents_idxs is not None:
-        for value_parent_idx, value_coupling_parent in zip(
-            value_parents_idxs,
-            attributes[node_idx]["value_coupling_parents"],
-        ):
+        # gather the (coupled) expected mean of each value parent, then reduce them
+        # against the coupling strengths in a single dot product
+        parent_values = []
+        for value_parent_idx in value_parents_idxs:
             # Get the coupling function
             child_position = edges[value_parent_idx].value_children.index(node_idx)
             coupling_fn = edges[value_parent_idx].coupling_fn[child_position]
@@ -97,8 +94,11 @@ def predict_mean_value_level(
                 parent_value = coupling_fn(
                     attributes[value_parent_idx]["expected_mean"]
                 )
+            parent_values.append(parent_value)
 
-            driftrate += value_coupling_parent * parent_value
+        driftrate += jnp.dot(
+            attributes[node_idx]["value_coupling_parents"], jnp.array(parent_values)
+        )
 
     # The new expected mean from the previous value
     expected_mean = (
@@ -178,9 +178,6 @@ def predict_precision_value_level(
 
     # Compute predicted volatility
     predicted_volatility = time_step * jnp.exp(total_volatility)
-    predicted_volatility = jnp.where(
-        predicted_volatility > 1e-128, predicted_volatility, jnp.nan
-    )
 
     # Laplace value-coupling correction. The conditional mean of the value level
     # is linearised around μ̂_b via a first-order Taylor expansion of the coupling
@@ -348,9 +345,6 @@ def predict_precision_value_level_mean_field(
     total_volatility = expected_mean_vol
 
     predicted_volatility = time_step * jnp.exp(total_volatility)
-    predicted_volatility = jnp.where(
-        predicted_volatility > 1e-128, predicted_volatility, jnp.nan
-    )
 
     expected_precision = 1 / ((1 / precision) + predicted_volatility)
     effective_precision = predicted_volatility * expected_precision
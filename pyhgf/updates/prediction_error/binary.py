@@ -4,6 +4,7 @@ from functools import partial
 
 import jax.numpy as jnp
 from jax import Array, jit
+from jax.nn import sigmoid
 
 from pyhgf.typing import Edges
 
@@ -89,15 +90,37 @@ def binary_finite_state_node_prediction_error(
     delata1 = attributes[value_child_idx]["temp"]["value_prediction_error_1"]
     expected_precision = attributes[value_child_idx]["expected_precision"]
 
-    # Likelihood under eta1
-    und1 = jnp.exp(-expected_precision / 2 * delata1**2)
+    # With an infinitely precise input, the likelihoods degenerate to indicator
+    # functions (the input is exactly eta1 or eta0). This limit is handled without
+    # branching so the whole update stays a single fused kernel.
+    is_infinite = jnp.isinf(expected_precision)
+    finite_precision = jnp.where(is_infinite, 1.0, expected_precision)
 
-    # Likelihood under eta0
-    und0 = jnp.exp(-expected_precision / 2 * delata0**2)
+    # Log-likelihoods under eta1 and eta0 (the shared normalisation cancels out)
+    log_und1 = -finite_precision / 2 * delata1**2
+    log_und0 = -finite_precision / 2 * delata0**2
 
-    # Eq. 39 in Mathys et al. (2014) (i.e., Bayes)
+    # Eq. 39 in Mathys et al. (2014) (i.e., Bayes), written as the sigmoid of the
+    # posterior log-odds instead of a ratio of exponentials
     expected_mean = attributes[node_idx]["expected_mean"]
-    mean = expected_mean * und1 / (expected_mean * und1 + (1 - expected_mean) * und0)
+    log_odds = jnp.log(expected_mean) - jnp.log1p(-expected_mean) + log_und1 - log_und0
+
+    # in the infinite precision limit the likelihoods are indicator functions. This
+    # ratio is 0/0 for finite inputs, so numerator and denominator are masked before
+    # the division (double where) to keep NaN out of the unselected branch gradients
+    und1 = delata1 == 0.0
+    und0 = delata0 == 0.0
+    indicator_denom = expected_mean * und1 + (1 - expected_mean) * und0
+
+    # an input that is neither eta1 nor eta0 has no support under the indicator
+    # likelihoods, the prior expected mean is then returned instead of 0/0
+    has_support = is_infinite & (indicator_denom > 0.0)
+    indicator_num = jnp.where(has_support, expected_mean * und1, 0.0)
+    indicator_denom = jnp.where(has_support, indicator_denom, 1.0)
+    indicator_mean = jnp.where(
+        has_support, indicator_num / indicator_denom, expected_mean
+    )
+    mean = jnp.where(is_infinite, indicator_mean, sigmoid(log_odds))
     precision = 1 / (expected_mean * (1 - expected_mean))
 
     attributes[node_idx]["mean"] = mean
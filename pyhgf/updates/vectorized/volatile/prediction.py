@@ -104,9 +104,6 @@ def vectorized_layer_prediction(
 
         # Predicted volatility for volatility level
         predicted_volatility_vol = time_step * jnp.exp(params.tonic_volatility_vol)
-        predicted_volatility_vol = jnp.where(
-            predicted_volatility_vol > 1e-128, predicted_volatility_vol, jnp.nan
-        )
 
         # Expected precision for volatility level
         expected_precision_vol = 1.0 / (
@@ -153,9 +150,6 @@ def vectorized_layer_prediction(
         total_volatility = expected_mean_vol + 1.0 / (2.0 * expected_precision_vol)
         # Predicted volatility for value level
         predicted_volatility = time_step * jnp.exp(total_volatility)
-        predicted_volatility = jnp.where(
-            predicted_volatility > 1e-128, predicted_volatility, jnp.nan
-        )
     else:
         # No volatility parent and no tonic volatility: the value level has no
         # volatility source, so it does not undergo a Gaussian random walk between
@@ -14,7 +14,7 @@ import dataclasses
 import jax.numpy as jnp
 from jax.nn import sigmoid
 
-from pyhgf.math import lambert_w0
+from pyhgf.math import gaussian_mixture_moments, lambert_w0
 from pyhgf.typing.vectorised import LayerState
 
 # ---------------------------------------------------------------------------
@@ -322,7 +322,8 @@ def vectorized_layer_volatility_posterior_unbounded(
     x_star = y_star - log_time_step
 
     # Log-space s2/w2/da2 — never materialise ``s2 = inf`` (0·∞ NaN gradients).
-    log_s2 = log_time_step + x_star
+    # By construction of x_star, the exponent log(s2) is y_star itself.
+    log_s2 = y_star
     log_denom_s = jnp.logaddexp(
         log_previous_variance, log_s2
     )  # = log(previous_variance + s2)
@@ -381,9 +382,10 @@ def vectorized_layer_volatility_posterior_unbounded(
     # ------------------------------------------------------------------
     # Gaussian mixture moment matching
     # ------------------------------------------------------------------
-    posterior_mean_vol = (1.0 - b) * mu1 + b * mu2
-    sig2 = (1.0 - b) / pi1 + b / pi2 + b * (1.0 - b) * (mu1 - mu2) ** 2
-    posterior_precision_vol = jnp.minimum(1.0 / sig2, max_posterior_precision)
+    posterior_mean_vol, posterior_precision = gaussian_mixture_moments(
+        mu1, pi1, mu2, pi2, b
+    )
+    posterior_precision_vol = jnp.minimum(posterior_precision, max_posterior_precision)
 
     return dataclasses.replace(
         layer,
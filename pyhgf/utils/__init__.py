@@ -1,6 +1,6 @@
 from .add_edges import add_edges
 from .add_parent import add_parent
-from .beliefs_propagation import beliefs_propagation
+from .beliefs_propagation import beliefs_propagation, beliefs_propagation_batched
 from .fill_categorical_state_node import fill_categorical_state_node
 from .get_input_idxs import get_input_idxs
 from .get_update_sequence import get_update_sequence
@@ -18,6 +18,7 @@ __all__ = [
     "add_edges",
     "add_parent",
     "beliefs_propagation",
+    "beliefs_propagation_batched",
     "fill_categorical_state_node",
     "get_input_idxs",
     "get_update_sequence",
@@ -4,7 +4,8 @@
 
 from functools import partial
 
-from jax import jit
+from jax import jit, random, vmap
+from jax.tree_util import Partial
 from jax.typing import ArrayLike
 
 from pyhgf.typing import Attributes, Edges, UpdateSequence
@@ -107,14 +108,17 @@ def beliefs_propagation(
     # 2. Receive new observations ------------------------------------------------------
     # ----------------------------------------------------------------------------------
     if observations == "generative":
+        # Split the key once so each input node is sampled independently
+        rng_keys = random.split(rng_key, len(input_idxs))
+
         # Inline handling of observation for each input node
-        for node_idx in input_idxs:
+        for node_idx, node_rng_key in zip(input_idxs, rng_keys):
             # Sample the node distribution
             sampled_value = sample_node_distribution(
                 attributes=attributes,
                 edges=edges,
                 node_idx=node_idx,
-                rng_key=rng_key,
+                rng_key=node_rng_key,
             )
             # Set the observation (using a constant observation flag, here set as 1)
             attributes = set_observation(
@@ -157,3 +161,61 @@ def beliefs_propagation(
         attributes,
         attributes,
     )  # ("carryover", "accumulated")
+
+
+@partial(
+    jit,
+    static_argnames=(
+        "update_sequence",
+        "edges",
+        "input_idxs",
+        "observations",
+    ),
+)
+def beliefs_propagation_batched(
+    attributes: Attributes,
+    inputs: tuple[ArrayLike, ...],
+    update_sequence: UpdateSequence,
+    edges: Edges,
+    input_idxs: tuple[int],
+    observations: str = "external",
+) -> tuple[dict, dict]:
+    """Update a batch of independent networks after observing new data point(s).
+
+    This is :py:func:`beliefs_propagation` vectorized over a leading batch axis, so
+    many chains or particles sharing the same network structure are updated in a
+    single compiled step instead of a Python loop.
+
+    Parameters
+    ----------
+    attributes :
+        The dictionaries of nodes' parameters, where every array has a leading batch
+        dimension (e.g. the attributes of each chain stacked with
+        ``jax.tree.map(lambda *x: jnp.stack(x), *attributes_list)``).
+    inputs :
+        The inputs passed to :py:func:`beliefs_propagation`, with the same leading
+        batch dimension. In generative mode, provide one PRNG key per batch element.
+    update_sequence :
+        The sequence of updates that will be applied to the node structure.
+    edges :
+        Information on the network's edges.
+    input_idxs :
+        List input indexes.
+    observations :
+        How the networks receive new observations. See :py:func:`beliefs_propagation`.
+
+    Returns
+    -------
+    attributes, attributes :
+        A tuple of batched parameters structure (carryover and accumulated).
+
+    """
+    return vmap(
+        Partial(
+            beliefs_propagation,
+            update_sequence=update_sequence,
+            edges=edges,
+            input_idxs=input_idxs,
+            observations=observations,
+        )
+    )(attributes, inputs)
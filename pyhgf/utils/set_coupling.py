@@ -1,5 +1,9 @@
 # Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
 
+import jax.numpy as jnp
+import numpy as np
+from jax.typing import ArrayLike
+
 from pyhgf.typing import Attributes, Edges
 
 
@@ -51,3 +55,58 @@ def set_coupling(
     )
 
     return attributes
+
+
+def _set_couplings(
+    attributes: Attributes,
+    edges: Edges,
+    child_idx: int,
+    couplings: ArrayLike,
+) -> Attributes:
+    """Set the coupling strengths between a child node and all its value parents.
+
+    This is the batched version of :py:func:`pyhgf.utils.set_coupling`. The child's
+    parents couplings are replaced in a single write, and the children couplings of
+    all the value parents are updated with a single scatter.
+
+    Parameters
+    ----------
+    attributes :
+        The attributes of the probabilistic network.
+    edges :
+        The edges of the probabilistic network as a tuple of
+        :py:class:`pyhgf.typing.Indexes`. The tuple has the same length as the number of
+        nodes. For each node, the index list value/volatility - parents/children.
+    child_idx :
+        Pointer to the child node.
+    couplings :
+        The new coupling strengths, one for each value parent of the child node, in the
+        order of `edges[child_idx].value_parents`.
+    """
+    value_parents = edges[child_idx].value_parents  # type: ignore
+
+    # 1. replace the whole row of parents couplings in the child node
+    # ----------------------------------------------------------------
+    attributes[child_idx]["value_coupling_parents"] = jnp.asarray(couplings)
+
+    # 2. mirror the new values in the children couplings of the parent nodes
+    # ----------------------------------------------------------------------
+    # the parents' children couplings are concatenated so that every parent is
+    # updated with one scatter, then sliced back with static bounds
+    children_couplings = [
+        attributes[parent_idx]["value_coupling_children"]
+        for parent_idx in value_parents
+    ]
+    offsets = np.cumsum([0] + [len(row) for row in children_couplings])
+    positions = np.array([
+        offset + edges[parent_idx].value_children.index(child_idx)  # type: ignore
+        for offset, parent_idx in zip(offsets, value_parents)
+    ])
+    flat_couplings = jnp.concatenate(children_couplings)
+    flat_couplings = flat_couplings.at[positions].set(
+        attributes[child_idx]["value_coupling_parents"]
+    )
+    for parent_idx, start, end in zip(value_parents, offsets[:-1], offsets[1:]):
+        attributes[parent_idx]["value_coupling_children"] = flat_couplings[start:end]
+
+    return attributes
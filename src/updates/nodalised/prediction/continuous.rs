@@ -79,8 +79,7 @@ pub fn prediction_continuous_state_node(network: &mut Network, node_idx: usize,
         }
     }
 
-    let pv_raw = time_step * total_volatility.exp();
-    let predicted_volatility = if pv_raw > 1e-128 { pv_raw } else { f64::NAN };
+    let predicted_volatility = time_step * total_volatility.exp();
     // Conditional predicted precision π̂_a — own variance + volatility only,
     // WITHOUT the parent-uncertainty value-coupling term. The parent's posterior-step
     // Schur complement acts on this; the marginal would double-count parent uncertainty.
@@ -151,8 +150,7 @@ pub fn prediction_continuous_state_node_mean_field(
         }
     }
 
-    let pv_raw = time_step * total_volatility.exp();
-    let predicted_volatility = if pv_raw > 1e-128 { pv_raw } else { f64::NAN };
+    let predicted_volatility = time_step * total_volatility.exp();
     let expected_precision = 1.0 / ((1.0 / precision) + predicted_volatility);
     let effective_precision = predicted_volatility * expected_precision;
 
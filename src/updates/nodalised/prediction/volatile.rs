@@ -33,8 +33,7 @@ pub fn prediction_volatile_state_node(network: &mut Network, node_idx: usize, ti
     // ===================================================================
     // 1. PREDICT VOLATILITY LEVEL (implicit internal state)
     // ===================================================================
-    let pvv_raw = time_step * tonic_volatility_vol.exp();
-    let predicted_volatility_vol = if pvv_raw > 1e-128 { pvv_raw } else { f64::NAN };
+    let predicted_volatility_vol = time_step * tonic_volatility_vol.exp();
     let expected_precision_vol = 1.0 / ((1.0 / precision_vol) + predicted_volatility_vol);
     let effective_precision_vol = predicted_volatility_vol * expected_precision_vol;
 
@@ -77,8 +76,7 @@ pub fn prediction_volatile_state_node(network: &mut Network, node_idx: usize, ti
     //         moment-generating-function correction 1 / (2 · π̂_vol) inside the
     //         log-volatility exponent.
     let total_volatility = mean_vol + 1.0 / (2.0 * expected_precision_vol);
-    let pv_raw = time_step * total_volatility.exp();
-    let predicted_volatility = if pv_raw > 1e-128 { pv_raw } else { f64::NAN };
+    let predicted_volatility = time_step * total_volatility.exp();
     // Conditional predicted precision π̂_a — precision of x_a given its value
     // parents (own variance + volatility only), WITHOUT the parent-uncertainty
     // value-coupling term. This is what the parent's posterior-step Schur
@@ -134,8 +132,7 @@ pub fn prediction_volatile_state_node_mean_field(
     let current_variance = 1.0 / precision;
 
     // Volatility level (unchanged)
-    let pvv_raw = time_step * tonic_volatility_vol.exp();
-    let predicted_volatility_vol = if pvv_raw > 1e-128 { pvv_raw } else { f64::NAN };
+    let predicted_volatility_vol = time_step * tonic_volatility_vol.exp();
     let expected_precision_vol = 1.0 / ((1.0 / precision_vol) + predicted_volatility_vol);
     let effective_precision_vol = predicted_volatility_vol * expected_precision_vol;
 
@@ -157,8 +154,7 @@ pub fn prediction_volatile_state_node_mean_field(
 
     // Value level precision — no MGF, no Laplace correction (coupling fixed at 1)
     let total_volatility = mean_vol;
-    let pv_raw = time_step * total_volatility.exp();
-    let predicted_volatility = if pv_raw > 1e-128 { pv_raw } else { f64::NAN };
+    let predicted_volatility = time_step * total_volatility.exp();
     let expected_precision = 1.0 / ((1.0 / precision) + predicted_volatility);
     let effective_precision = predicted_volatility * expected_precision;
 
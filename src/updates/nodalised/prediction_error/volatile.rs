@@ -233,8 +233,10 @@ fn unbounded_volatility_level_update(
     let b = 1.0 / (1.0 + (i1 - i2).exp()); // sigmoid(i2 - i1)
 
     // Gaussian mixture moment matching
-    let posterior_mean = (1.0 - b) * mu1 + b * mu2;
-    let sig2 = (1.0 - b) / pi1 + b / pi2 + b * (1.0 - b) * (mu1 - mu2).powi(2);
+    // The mean is an interpolation from expansion 1 towards expansion 2.
+    let delta_mu = mu2 - mu1;
+    let posterior_mean = mu1 + b * delta_mu;
+    let sig2 = (1.0 - b) / pi1 + b / pi2 + b * (1.0 - b) * delta_mu.powi(2);
     let posterior_precision = 1.0 / sig2;
 
     (posterior_precision, posterior_mean)
@@ -1,7 +1,7 @@
 //! Top-down prediction for volatile-node layers, mirroring
 //! `pyhgf/updates/vectorized/volatile/prediction.py`.
 
-use super::guarded_volatility;
+use super::scaled_volatility;
 use crate::math::{with_coupling, CouplingFn};
 use crate::vectorised::layer::{LayerParams, LayerState};
 use crate::vectorised::mat::{Float, Matrix};
@@ -49,7 +49,7 @@ pub fn layer_prediction(
                 .and(precision_vol)
                 .and(&child_params.tonic_volatility_vol)
                 .for_each(|e, ev, &pv_prec, &tvv| {
-                    let pvv = guarded_volatility(tvv, time_step);
+                    let pvv = scaled_volatility(tvv, time_step);
                     let epval = 1.0 / (1.0 / pv_prec + pvv);
                     *e = epval;
                     *ev = pvv * epval;
@@ -88,7 +88,7 @@ pub fn layer_prediction(
         let epv = expected_precision_vol.as_ref().unwrap();
         ndarray::Zip::from(emv)
             .and(epv)
-            .map_collect(|&m, &pv| guarded_volatility(m + 1.0 / (pv * 2.0), time_step))
+            .map_collect(|&m, &pv| scaled_volatility(m + 1.0 / (pv * 2.0), time_step))
     } else {
         // No volatility parent and no tonic volatility: the value level has no
         // volatility source, so it does not undergo a Gaussian random walk. The
@@ -100,9 +100,9 @@ fn volatility_posterior_standard(state: &mut LayerState, max_posterior_precision
 /// increment recomputed from the updated mean and floored at zero. Returns
 /// `(precision_vol, mean_vol)`.
 ///
-/// Plain exponentials: the JAX eHGF posterior applies no underflow guard here
-/// (unlike the prediction kernels' `guarded_volatility`); the only floor is
-/// the [`MIN_VOLATILITY`] clamp on `previous_variance`. The per-node backend's
+/// Plain exponentials, as in the prediction kernels' `scaled_volatility`: the
+/// JAX eHGF posterior applies no underflow guard here; the only floor is the
+/// [`MIN_VOLATILITY`] clamp on `previous_variance`. The per-node backend's
 /// eHGF update follows the same convention.
 #[inline]
 #[allow(clippy::too_many_arguments)]
@@ -285,7 +285,8 @@ pub(crate) fn unbounded_vol_node(
     let y_star = gamma_c + v_w - 0.5 / pihat_y;
     let x_star = y_star - log_time_step;
 
-    let log_s2 = log_time_step + x_star;
+    // By construction of x_star, the exponent log(s2) is y_star itself.
+    let log_s2 = y_star;
     let log_denom_s = logaddexp(log_previous_variance, log_s2);
     let w2 = sigmoid(log_s2 - log_previous_variance);
     let da2 = be_aux * (-log_denom_s).exp() - 1.0;
@@ -319,8 +320,10 @@ pub(crate) fn unbounded_vol_node(
     let b = sigmoid(i2 - i1);
 
     // Gaussian mixture moment matching.
-    let mu = (1.0 - b) * mu1 + b * mu2;
-    let sig2 = (1.0 - b) / pi1 + b / pi2 + b * (1.0 - b) * (mu1 - mu2) * (mu1 - mu2);
+    // The mean is an interpolation from expansion 1 towards expansion 2.
+    let delta_mu = mu2 - mu1;
+    let mu = mu1 + b * delta_mu;
+    let sig2 = (1.0 - b) / pi1 + b / pi2 + b * (1.0 - b) * delta_mu * delta_mu;
     (
         ((1.0 / sig2).min(max_posterior_precision)) as Float,
         mu as Float,
@@ -15,10 +15,10 @@
 use crate::math::sigmoid;
 use crate::updates::vectorised::learning::WeightKind;
 use crate::updates::vectorised::softmax_inplace;
-use crate::updates::vectorised::volatile::guarded_volatility;
 use crate::updates::vectorised::volatile::prediction_error::{
     ehgf_vol_node, standard_vol_node, unbounded_vol_node, volatility_pe_node,
 };
+use crate::updates::vectorised::volatile::scaled_volatility;
 use crate::vectorised::layer::{DeepNet, Layer, LayerKind, LayerState, VolatilityUpdate};
 use crate::vectorised::mat::{Float, Matrix, Vector};
 use ndarray::parallel::prelude::*;
@@ -207,7 +207,7 @@ fn batched_volatile_prediction(
             .and(precision_vol.rows())
             .and(&params.tonic_volatility_vol)
             .for_each(|mut em_row, mut ep_row, mv, pv, &tvv| {
-                let pvv = guarded_volatility(tvv, time_step);
+                let pvv = scaled_volatility(tvv, time_step);
                 Zip::from(&mut em_row)
                     .and(&mut ep_row)
                     .and(&mv)
@@ -277,7 +277,7 @@ fn batched_volatile_prediction(
                     .and(&em)
                     .and(&ep)
                     .for_each(|o, &m, &pvv| {
-                        *o = guarded_volatility(m + 1.0 / (pvv * 2.0), time_step);
+                        *o = scaled_volatility(m + 1.0 / (pvv * 2.0), time_step);
                     });
             });
         Zip::from(&mut child.conditional_expected_precision)
@@ -1,10 +1,16 @@
 # Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
 
+import jax
 import jax.numpy as jnp
+import pytest
 
 from pyhgf import load_data
 from pyhgf.math import binary_surprise, gaussian_density
 from pyhgf.model import Network
+from pyhgf.typing import AdjacencyLists
+from pyhgf.updates.prediction_error.binary import (
+    binary_finite_state_node_prediction_error,
+)
 from pyhgf.utils import beliefs_propagation
 
 
@@ -122,3 +128,82 @@ def test_volatile_examples():
 
     hgf.input_data(input_data=jnp.asarray(input_data))
     assert not jnp.any(jnp.isnan(hgf.node_trajectories[0]["expected_mean"]))
+
+
+@pytest.mark.parametrize(
+    "expected_precision, prediction_errors, expected_mean, expected",
+    [
+        # finite precision
+        (1.0, (1.0, 0.0), 0.5, 0.6224593),
+        # infinite precision, the input is eta1
+        (jnp.inf, (1.0, 0.0), 0.5, 1.0),
+        # infinite precision, the input is eta0
+        (jnp.inf, (0.0, 1.0), 0.5, 0.0),
+        # infinite precision, the input is neither eta0 nor eta1: prior mean
+        (jnp.inf, (0.3, -0.7), 0.2, 0.2),
+    ],
+)
+def test_binary_finite_state_node_prediction_error(
+    expected_precision, prediction_errors, expected_mean, expected
+):
+    """Test the finite-precision binary update and its infinite precision limit."""
+    edges = (
+        AdjacencyLists(1, None, None, (1,), None, (None,)),
+        AdjacencyLists(2, (0,), None, None, None, None),
+    )
+
+    attributes = {
+        0: {"expected_mean": expected_mean, "mean": 0.5, "precision": 1.0},
+        1: {
+            "expected_precision": expected_precision,
+            "temp": {
+                "value_prediction_error_0": prediction_errors[0],
+                "value_prediction_error_1": prediction_errors[1],
+            },
+        },
+    }
+    attributes = binary_finite_state_node_prediction_error(
+        attributes=attributes, node_idx=0, edges=edges
+    )
+    assert jnp.isclose(attributes[0]["mean"], expected, atol=1e-5)
+    assert jnp.isclose(
+        attributes[0]["precision"], 1 / (expected_mean * (1 - expected_mean))
+    )
+
+
+def test_binary_finite_state_node_prediction_error_gradient():
+    """Test that the finite-precision update has finite gradients.
+
+    The infinite precision branch is not selected for finite inputs and must not leak
+    NaN into the gradients.
+    """
+    edges = (
+        AdjacencyLists(1, None, None, (1,), None, (None,)),
+        AdjacencyLists(2, (0,), None, None, None, None),
+    )
+
+    def posterior_mean(expected_mean):
+        attributes = {
+            0: {"expected_mean": expected_mean, "mean": 0.5, "precision": 1.0},
+            1: {
+                "expected_precision": 1.0,
+                "temp": {
+                    "value_prediction_error_0": 0.3,
+                    "value_prediction_error_1": -0.7,
+                },
+            },
+        }
+        attributes = binary_finite_state_node_prediction_error(
+            attributes=attributes, node_idx=0, edges=edges
+        )
+        return attributes[0]["mean"]
+
+    expected_mean = 0.5
+    grad = jax.grad(posterior_mean)(expected_mean)
+    assert jnp.isfinite(grad)
+
+    # d/dm sigmoid(logit(m) + L) = s * (1 - s) / (m * (1 - m))
+    s = posterior_mean(expected_mean)
+    assert jnp.isclose(
+        grad, s * (1 - s) / (expected_mean * (1 - expected_mean)), atol=1e-5
+    )
@@ -1,18 +1,21 @@
 # Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
 
+import jax
 import jax.numpy as jnp
 import numpy as np
+from jax.nn import sigmoid
 
 from pyhgf.model import Network
+from pyhgf.typing import AdjacencyLists
+from pyhgf.updates.posterior.categorical import categorical_state_update
 
 
 def test_categorical_state_node():
     """Test the categorical state node."""
     # generate some categorical inputs data
     np.random.seed(123)
-    input_data = np.array(
-        [np.random.multinomial(n=1, pvals=[0.1, 0.2, 0.7]) for _ in range(10)],
-        dtype=float,
+    input_data = np.random.multinomial(n=1, pvals=[0.1, 0.2, 0.7], size=10).astype(
+        float
     )
 
     # create the categorical HGF
@@ -84,3 +87,33 @@ def test_categorical_state_node():
     assert jnp.isclose(
         categorical_hgf.node_trajectories[0]["surprise"].sum(), 12.418026
     )
+
+
+def test_categorical_state_update_no_parent_update():
+    """Test the categorical update when the binary parents did not move."""
+    edges = (
+        AdjacencyLists(5, (1, 2), None, None, None, None),
+        AdjacencyLists(1, (3,), None, (0,), None, None),
+        AdjacencyLists(1, (4,), None, (0,), None, None),
+        AdjacencyLists(2, None, None, (1,), None, (None,)),
+        AdjacencyLists(2, None, None, (2,), None, (None,)),
+    )
+
+    def alpha_sum(parent_mean):
+        attributes = {
+            0: {"mean": jnp.array([1.0, 0.0]), "alpha": jnp.ones(2)},
+            1: {"expected_mean": 0.5},
+            2: {"expected_mean": sigmoid(1.0)},
+            3: {"mean": parent_mean},
+            4: {"mean": 2.0},
+        }
+        attributes = categorical_state_update(
+            attributes=attributes, node_idx=0, edges=edges
+        )
+        return attributes[0]["alpha"].sum(), attributes[0]["alpha"]
+
+    # the first parent did not move, so its concentration parameter falls back to 1
+    (_, alpha), gradient = jax.value_and_grad(alpha_sum, has_aux=True)(0.0)
+    assert alpha[0] == 1.0
+    assert jnp.isfinite(alpha[1])
+    assert jnp.isfinite(gradient)
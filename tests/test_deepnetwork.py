@@ -407,71 +407,64 @@ def test_three_backends_binary_volatile():
         # ---- Hidden-layer volatile states ----
         # Rust/Python node layout: binary(0), intermediate(1), hidden(2..2+n_hidden)
         # JAX: dn.state.layers[2] holds the hidden layer (index 2 in add_layer order)
-        for i in range(n_hidden):
-            node_idx = 2 * n_targets + i  # Rust/Python index
+        # Each field is stacked across the hidden nodes and compared in one call.
+        hidden_idxs = range(2 * n_targets, 2 * n_targets + n_hidden)
+        jax_hidden = dn.state.layers[2].state
+        for key in ["mean", "precision", "mean_vol", "precision_vol"]:
+            rs_values = np.array([
+                float(rs.node_trajectories[i][key][-1]) for i in hidden_idxs
+            ])
+            py_values = np.array([
+                float(net.last_attributes[i][key]) for i in hidden_idxs
+            ])
+            jax_values = np.asarray(getattr(jax_hidden, key))[:n_hidden]
 
-            rs_mean = float(rs.node_trajectories[node_idx]["mean"][-1])
-            py_mean = float(net.last_attributes[node_idx]["mean"])
-            jax_mean = float(dn.state.layers[2].state.mean[i])
-
-            assert np.allclose(py_mean, rs_mean, atol=atol_rs_py_local), (
-                f"{label}: hidden[{i}] mean: Python={py_mean} vs Rust={rs_mean}"
-            )
-            assert np.allclose(jax_mean, rs_mean, atol=atol_jax_local), (
-                f"{label}: hidden[{i}] mean: JAX={jax_mean} vs Rust={rs_mean}"
-            )
-
-            rs_prec = float(rs.node_trajectories[node_idx]["precision"][-1])
-            py_prec = float(net.last_attributes[node_idx]["precision"])
-            jax_prec = float(dn.state.layers[2].state.precision[i])
-
-            assert np.allclose(py_prec, rs_prec, atol=atol_rs_py_local), (
-                f"{label}: hidden[{i}] precision: Python={py_prec} vs Rust={rs_prec}"
-            )
-            assert np.allclose(jax_prec, rs_prec, atol=atol_jax_local), (
-                f"{label}: hidden[{i}] precision: JAX={jax_prec} vs Rust={rs_prec}"
-            )
-
-            rs_mean_vol = float(rs.node_trajectories[node_idx]["mean_vol"][-1])
-            py_mean_vol = float(net.last_attributes[node_idx]["mean_vol"])
-            jax_mean_vol = float(dn.state.layers[2].state.mean_vol[i])
-
-            assert np.allclose(py_mean_vol, rs_mean_vol, atol=atol_rs_py_local), (
-                f"{label}: hidden[{i}] mean_vol: Python={py_mean_vol} vs Rust={rs_mean_vol}"
-            )
-            assert np.allclose(jax_mean_vol, rs_mean_vol, atol=atol_jax_local), (
-                f"{label}: hidden[{i}] mean_vol: JAX={jax_mean_vol} vs Rust={rs_mean_vol}"
-            )
-
-            rs_prec_vol = float(rs.node_trajectories[node_idx]["precision_vol"][-1])
-            py_prec_vol = float(net.last_attributes[node_idx]["precision_vol"])
-            jax_prec_vol = float(dn.state.layers[2].state.precision_vol[i])
-
-            assert np.allclose(py_prec_vol, rs_prec_vol, atol=atol_rs_py_local), (
-                f"{label}: hidden[{i}] precision_vol: Python={py_prec_vol} vs Rust={rs_prec_vol}"
+            np.testing.assert_allclose(
+                py_values,
+                rs_values,
+                rtol=1e-5,
+                atol=atol_rs_py_local,
+                equal_nan=False,
+                err_msg=f"{label}: hidden {key}: Python vs Rust",
             )
-            assert np.allclose(jax_prec_vol, rs_prec_vol, atol=atol_jax_local), (
-                f"{label}: hidden[{i}] precision_vol: JAX={jax_prec_vol} vs Rust={rs_prec_vol}"
+            np.testing.assert_allclose(
+                jax_values,
+                rs_values,
+                rtol=1e-5,
+                atol=atol_jax_local,
+                equal_nan=False,
+                err_msg=f"{label}: hidden {key}: JAX vs Rust",
             )
 
         # ---- Coupling weights: hidden ← input ----
         # JAX: weights[2] connects layer[2] (hidden, rows) to layer[3] (input, cols),
         #      shape (n_hidden, n_input).
-        for j in range(n_hidden):
-            node_idx = 2 * n_targets + j
-            for k in range(n_input):
-                w_py = float(net.last_attributes[node_idx]["value_coupling_parents"][k])
-                w_rs = float(
-                    rs.node_trajectories[node_idx]["value_coupling_parents"][-1][k]
-                )
-                w_jax = float(dn.state.weights[2][j, k])
+        w_py = np.array([
+            np.asarray(net.last_attributes[i]["value_coupling_parents"])[:n_input]
+            for i in hidden_idxs
+        ])
+        w_rs = np.array([
+            np.asarray(rs.node_trajectories[i]["value_coupling_parents"][-1])[:n_input]
+            for i in hidden_idxs
+        ])
+        w_jax = np.asarray(dn.state.weights[2])[:n_hidden, :n_input]
 
-                assert np.allclose(w_py, w_rs, atol=atol_rs_py_local), (
-                    f"{label}: weight hidden[{j}]←input[{k}]: Python={w_py} vs Rust={w_rs}"
-                )
-                assert np.allclose(w_jax, w_rs, atol=atol_jax_local), (
-                    f"{label}: weight hidden[{j}]←input[{k}]: JAX={w_jax} vs Rust={w_rs}"
-                )
+        np.testing.assert_allclose(
+            w_py,
+            w_rs,
+            rtol=1e-5,
+            atol=atol_rs_py_local,
+            equal_nan=False,
+            err_msg=f"{label}: weights hidden←input: Python vs Rust",
+        )
+        np.testing.assert_allclose(
+            w_jax,
+            w_rs,
+            rtol=1e-5,
+            atol=atol_jax_local,
+            equal_nan=False,
+            err_msg=f"{label}: weights hidden←input: JAX vs Rust",
+        )
 
         # ---- Binary coupling weights ----
         # All three backends now learn binary-to-parent weights via sigmoid coupling.
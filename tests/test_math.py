@@ -6,6 +6,8 @@ from pyhgf.math import (
     Normal,
     binary_surprise,
     binary_surprise_finite_precision,
+    first_and_second_derivatives,
+    gaussian_mixture_moments,
     gaussian_predictive_distribution,
     gaussian_surprise,
     sigmoid_inverse_temperature,
@@ -21,7 +23,7 @@ def test_binary_surprise():
     assert jnp.isclose(s, 1.60943791)
 
     s = binary_surprise(x=0.0, expected_mean=0.0, clipping=True)
-    assert jnp.isclose(s, 1.0132795e-06)
+    assert jnp.isclose(s, 1.0000005e-06)
 
     s = binary_surprise(x=0.0, expected_mean=1.0, clipping=True)
     assert jnp.isclose(s, 13.802319)
@@ -32,6 +34,13 @@ def test_binary_surprise():
     s = binary_surprise(x=0.0, expected_mean=1.0, clipping=False)
     assert jnp.isinf(s)
 
+    s = binary_surprise(x=1.0, expected_mean=1.0, clipping=False)
+    assert s == 0.0
+
+    # non-binary outcomes are treated as x=1, not as a cross-entropy
+    s = binary_surprise(x=0.3, expected_mean=0.8, clipping=True)
+    assert jnp.isclose(s, 0.22314355)
+
 
 def test_gaussian_surprise():
     """Test the Gaussian surprise function."""
@@ -97,10 +106,47 @@ def test_binary_surprise_finite_precision():
         eta0=0.0,
         eta1=1.0,
     )
-    assert surprise == 1.4189385
+    assert jnp.isclose(surprise, 1.4189385)
+
+
+def test_first_and_second_derivatives():
+    """Test the first and second derivatives helper."""
+    first, second = first_and_second_derivatives(jnp.tanh, 0.3)
+    assert jnp.isclose(first, 1 - jnp.tanh(0.3) ** 2)
+    assert jnp.isclose(second, -2 * jnp.tanh(0.3) * (1 - jnp.tanh(0.3) ** 2))
 
 
 def test_sigmoid_inverse_temperature():
     """Test the sigmoid inverse temperature function."""
     s = sigmoid_inverse_temperature(x=0.4, temperature=6.0)
     assert jnp.isclose(s, jnp.array(0.08070617906683485, dtype="float32"))
+
+
+def test_gaussian_mixture_moments():
+    """Test the mixture moment matching with widely separated precisions."""
+    mean, precision = gaussian_mixture_moments(
+        mean_1=jnp.float32(0.0),
+        precision_1=jnp.float32(1.0),
+        mean_2=jnp.float32(0.0),
+        precision_2=jnp.float32(1e8),
+        weight=jnp.float32(1.0),
+    )
+    assert jnp.isfinite(precision)
+    assert jnp.isclose(precision, 1e8)
+    assert mean == 0.0
+
+    _, precision = gaussian_mixture_moments(
+        mean_1=jnp.float32(0.0),
+        precision_1=jnp.float32(1.0),
+        mean_2=jnp.float32(0.0),
+        precision_2=jnp.float32(1e4),
+        weight=jnp.float32(1.0),
+    )
+    assert jnp.isclose(precision, 1e4, rtol=1e-6)
+
+    # the mixture spread term widens the variance when the means differ
+    mean, precision = gaussian_mixture_moments(
+        mean_1=0.0, precision_1=1.0, mean_2=2.0, precision_2=1.0, weight=0.5
+    )
+    assert jnp.isclose(mean, 1.0)
+    assert jnp.isclose(precision, 0.5)
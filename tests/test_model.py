@@ -1,6 +1,8 @@
 # Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
 
 import importlib
+from collections import OrderedDict
+from functools import partial
 
 import jax.numpy as jnp
 import numpy as np
@@ -8,6 +10,7 @@ from pytest import raises, warns
 
 import pyhgf.model
 import pyhgf.model.hgf
+import pyhgf.model.network as network_module
 from pyhgf import load_data
 from pyhgf.model import Network
 from pyhgf.response import (
@@ -94,6 +97,49 @@ def test_network():
         custom_hgf.add_nodes(kind="error")
 
 
+def test_belief_propagation_fn_cache():
+    """Networks with the same topology share their belief propagation function."""
+
+    def make_network(volatility_updates="unbounded"):
+        return (
+            Network(volatility_updates=volatility_updates)
+            .add_nodes()
+            .add_nodes(value_children=0)
+            .add_nodes(volatility_children=1)
+            .create_belief_propagation_fn()
+        )
+
+    network_1, network_2 = make_network(), make_network()
+    assert network_1.scan_fn is network_2.scan_fn
+
+    # a different update sequence uses a different function
+    assert make_network("eHGF").scan_fn is not network_1.scan_fn
+
+    # the shared function does not leak beliefs between networks
+    network_1.input_data(input_data=np.ones(5))
+    network_2.input_data(input_data=np.zeros(5))
+    assert not jnp.isclose(
+        network_1.node_trajectories[1]["mean"][-1],
+        network_2.node_trajectories[1]["mean"][-1],
+    )
+
+
+def test_belief_propagation_fn_cache_bounds_and_types(monkeypatch):
+    """The shared function cache is bounded and distinguishes parameter types."""
+    monkeypatch.setattr(network_module, "_BELIEF_PROPAGATION_FN_CACHE", OrderedDict())
+    monkeypatch.setattr(network_module, "_BELIEF_PROPAGATION_FN_CACHE_SIZE", 2)
+
+    for n_nodes in range(1, 5):
+        Network().add_nodes(n_nodes=n_nodes).create_belief_propagation_fn()
+    assert len(network_module._BELIEF_PROPAGATION_FN_CACHE) == 2
+
+    # values that compare equal but differ in type give different keys
+    step_int = network_module._step_key(partial(abs, 1))
+    step_float = network_module._step_key(partial(abs, 1.0))
+    step_bool = network_module._step_key(partial(abs, True))
+    assert len({step_int, step_float, step_bool}) == 3
+
+
 def test_constant_state_nodes_reject_invalid_parent_links():
     """Constant-state nodes must not be children of any other node."""
     net = Network().add_nodes(kind="volatile-state")
@@ -431,6 +477,29 @@ def test_network_predict():
     assert np.all(np.isfinite(np.asarray(preds)))
 
 
+def test_fit_reuses_learning_fn():
+    """Repeated calls to fit() reuse the learning function and its compiled scan."""
+    net = (
+        Network()
+        .add_nodes(kind="continuous-state")
+        .add_nodes(kind="volatile-state", value_children=0)
+    )
+    np.random.seed(42)
+    x, y = np.random.randn(5, 1), np.random.randn(5, 1)
+
+    net.fit(x=x, y=y, inputs_x_idxs=(1,), inputs_y_idxs=(0,), lr=0.1)
+    scan_fn = net.scan_fn
+
+    # the scan function is a static argument of the jitted scan, hashed by identity,
+    # so returning the same object is what lets the compiled scan be reused
+    net.fit(x=x, y=y, inputs_x_idxs=(1,), inputs_y_idxs=(0,), lr=0.1)
+    assert net.scan_fn is scan_fn
+
+    # different learning parameters use a different function
+    net.fit(x=x, y=y, inputs_x_idxs=(1,), inputs_y_idxs=(0,), lr=0.2)
+    assert net.scan_fn is not scan_fn
+
+
 def test_network_input_data_no_trajectories():
     """Test Network.input_data() with record_trajectories=False."""
     timeserie = load_data("continuous")
@@ -0,0 +1,13 @@
+# Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
+
+"""Shared fixtures for the node-level backend comparison tests."""
+
+import pytest
+
+from pyhgf import load_data
+
+
+@pytest.fixture(scope="session")
+def continuous_data():
+    """USD-CHF continuous input series."""
+    return load_data("continuous")
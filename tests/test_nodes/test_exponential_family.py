@@ -4,46 +4,74 @@ import jax.numpy as jnp
 import numpy as np
 from pyhgf.rshgf import Network as RsNetwork
 
-from pyhgf import load_data
 from pyhgf.model import Network as PyNetwork
 
 NETWORK_CLASSES = [PyNetwork, RsNetwork]
 
+# expected final sufficient statistics of the bivariate normal node on the spiral
+# data set, under generalised filtering and HGF learning respectively
+_EXPECTED_XIS_FILTERING = jnp.array(
+    [3.4652710e01, -1.0609777e00, 1.2103647e03, -3.6398651e01, 3.3951855e00],
+    dtype="float32",
+)
+_EXPECTED_XIS_HGF = jnp.array(
+    [3.5066551e01, -9.8721796e-01, 1.2390380e03, -3.4500877e01, 2.2432587e00],
+    dtype="float32",
+)
+
+# prior parameter values of the bivariate HGF adapted to the sufficient statistics:
+# covariances statistics will have greater variability and amplitudes
+_BIVARIATE_HGF_PRIORS = (
+    *((node_idx, "tonic_volatility", -2.0) for node_idx in (2, 5, 8, 11, 14)),
+    *((node_idx, "precision", 0.01) for node_idx in (1, 4, 7, 10, 13)),
+    *((node_idx, "mean", 10.0) for node_idx in (9, 12, 15)),
+)
+
+
+def _make_spiral(seed: int = 123, n: int = 1000) -> np.ndarray:
+    """Simulate an ordered 2D spiral data set of shape (n, 2)."""
+    rng = np.random.RandomState(seed)
+    theta = np.sort(np.sqrt(rng.rand(n)) * 5 * np.pi)
+    r_a = -2 * theta - np.pi
+    return np.array([np.cos(theta) * r_a, np.sin(theta) * r_a]).T + rng.randn(n, 2) * 2
+
+
+_SPIRAL_DATA = _make_spiral()
+
+
+def _stack_gaussian_trajectories(net):
+    """Stack the Gaussian node's xis (T, 2), mean (T,) and nus (T,) into (T, 4)."""
+    return np.column_stack([
+        np.asarray(net.node_trajectories[0][key]) for key in ["xis", "mean", "nus"]
+    ])
 
-def test_gaussian():
-    """Test the Gaussian node."""
-    timeseries = load_data("continuous")
 
+def test_gaussian(continuous_data):
+    """Test the Gaussian node."""
     results = {}
     for cls in NETWORK_CLASSES:
         results[cls.__name__] = (
-            cls().add_nodes(kind="ef-state").input_data(input_data=timeseries)
+            cls().add_nodes(kind="ef-state").input_data(input_data=continuous_data)
         )
 
     # Ensure identical results across implementations
     ref = results[NETWORK_CLASSES[0].__name__]
+    ref_stack = _stack_gaussian_trajectories(ref)
     for name, net in results.items():
         if net is ref:
             continue
-        for key in ["xis", "mean", "nus"]:
-            assert np.isclose(
-                ref.node_trajectories[0][key],
-                net.node_trajectories[0][key],
-            ).all(), f"{name} key '{key}' mismatch"
+        np.testing.assert_allclose(
+            _stack_gaussian_trajectories(net),
+            ref_stack,
+            rtol=1e-5,
+            atol=1e-8,
+            equal_nan=False,
+            err_msg=f"{name}: xis/mean/nus trajectories mismatch",
+        )
 
 
 def test_multivariate_gaussian():
     """Test the multivariate Gaussian node."""
-    # simulate an ordered spiral data set
-    np.random.seed(123)
-    N = 1000
-    theta = np.sort(np.sqrt(np.random.rand(N)) * 5 * np.pi)
-    r_a = -2 * theta - np.pi
-    spiral_data = (
-        np.array([np.cos(theta) * r_a, np.sin(theta) * r_a]).T
-        + np.random.randn(N, 2) * 2
-    )
-
     # Python
     # ----------------------------------------------------------------------------------
 
@@ -56,15 +84,15 @@ def test_multivariate_gaussian():
             distribution="multivariate-normal",
             dimension=2,
         )
-        .input_data(input_data=spiral_data)
+        .input_data(input_data=_SPIRAL_DATA)
     )
-    assert jnp.isclose(
+    np.testing.assert_allclose(
         bivariate_normal.node_trajectories[0]["xis"][-1],
-        jnp.array(
-            [3.4652710e01, -1.0609777e00, 1.2103647e03, -3.6398651e01, 3.3951855e00],
-            dtype="float32",
-        ),
-    ).all()
+        _EXPECTED_XIS_FILTERING,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
+    )
 
     # hgf updates
     bivariate_hgf = PyNetwork().add_nodes(
@@ -75,20 +103,15 @@ def test_multivariate_gaussian():
     )
 
     # adapting prior parameter values to the sufficient statistics
-    # covariances statistics will have greater variability and amplitudes
-    for node_idx in [2, 5, 8, 11, 14]:
-        bivariate_hgf.attributes[node_idx]["tonic_volatility"] = -2.0
-    for node_idx in [1, 4, 7, 10, 13]:
-        bivariate_hgf.attributes[node_idx]["precision"] = 0.01
-    for node_idx in [9, 12, 15]:
-        bivariate_hgf.attributes[node_idx]["mean"] = 10.0
+    for node_idx, key, value in _BIVARIATE_HGF_PRIORS:
+        bivariate_hgf.attributes[node_idx][key] = value
 
-    bivariate_hgf.input_data(input_data=spiral_data)
+    bivariate_hgf.input_data(input_data=_SPIRAL_DATA)
 
-    assert jnp.isclose(
-        bivariate_normal.node_trajectories[0]["xis"][-1],
-        jnp.array(
-            [3.4652710e01, -1.0609777e00, 1.2103647e03, -3.6398651e01, 3.3951855e00],
-            dtype="float32",
-        ),
-    ).all()
+    np.testing.assert_allclose(
+        bivariate_hgf.node_trajectories[0]["xis"][-1],
+        _EXPECTED_XIS_HGF,
+        rtol=1e-5,
+        atol=1e-8,
+        equal_nan=False,
+    )
@@ -1,42 +1,62 @@
 # Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
 
+import jax
 import numpy as np
 import pytest
 from pyhgf.rshgf import Network as RsNetwork
 
-from pyhgf import load_data
 from pyhgf.model import Network as PyNetwork
 
 UPDATE_TYPES = ["standard", "eHGF", "unbounded"]
 
+# volatility-level keys of a volatile-state node and their explicit-node counterparts
+_VOL_LEVEL_KEYS = (
+    "mean_vol",
+    "expected_mean_vol",
+    "precision_vol",
+    "expected_precision_vol",
+)
+_EXPLICIT_LEVEL_KEYS = ("mean", "expected_mean", "precision", "expected_precision")
 
-def _assert_value_level_match(net_a, node_a, net_b, node_b, label="", rtol=1e-5):
+
+def _host_trajectories(net):
+    """Fetch all node trajectories of a network to host memory in one transfer.
+
+    The helpers below take these host-side trajectories, so each network is
+    extracted once even when several of its nodes are compared.
+    """
+    return jax.device_get(net.node_trajectories)
+
+
+def _assert_value_level_match(traj_a, node_a, traj_b, node_b, label="", rtol=1e-5):
     """Assert value-level trajectories match between two networks."""
     for key in ["mean", "expected_mean", "precision", "expected_precision"]:
-        assert np.allclose(
-            net_a.node_trajectories[node_a][key],
-            net_b.node_trajectories[node_b][key],
+        np.testing.assert_allclose(
+            traj_a[node_a][key],
+            traj_b[node_b][key],
             rtol=rtol,
-        ), f"{label}: Value-level key '{key}' mismatch"
+            atol=1e-8,
+            equal_nan=False,
+            err_msg=f"{label}: Value-level key '{key}' mismatch",
+        )
 
 
 def _assert_vol_level_match(
-    volatile_net, vol_node, explicit_net, exp_node, label="", rtol=1e-4, atol=1e-6
+    volatile_traj, vol_node, explicit_traj, exp_node, label="", rtol=1e-4, atol=1e-6
 ):
     """Assert volatility-level trajectories match (volatile _vol vs explicit node)."""
-    vol_key_map = {
-        "mean_vol": "mean",
-        "expected_mean_vol": "expected_mean",
-        "precision_vol": "precision",
-        "expected_precision_vol": "expected_precision",
-    }
-    for vol_key, explicit_key in vol_key_map.items():
-        assert np.allclose(
-            volatile_net.node_trajectories[vol_node][vol_key],
-            explicit_net.node_trajectories[exp_node][explicit_key],
-            rtol=rtol,
-            atol=atol,
-        ), f"{label}: Volatility-level key '{vol_key}' vs '{explicit_key}' mismatch"
+    # one comparison over the stacked (key, time) trajectories
+    np.testing.assert_allclose(
+        np.stack([volatile_traj[vol_node][key] for key in _VOL_LEVEL_KEYS]),
+        np.stack([explicit_traj[exp_node][key] for key in _EXPLICIT_LEVEL_KEYS]),
+        rtol=rtol,
+        atol=atol,
+        equal_nan=False,
+        err_msg=(
+            f"{label}: Volatility-level keys {_VOL_LEVEL_KEYS} (rows) vs "
+            f"{_EXPLICIT_LEVEL_KEYS} mismatch"
+        ),
+    )
 
 
 def _build_volatile(cls, volatility_updates, timeseries, mean_field_updates=False):
@@ -74,71 +94,60 @@ def _build_explicit(cls, volatility_updates, timeseries, mean_field_updates=Fals
     )
 
 
-def _run_volatile_vs_explicit(volatility_updates):
+@pytest.fixture(scope="module", params=UPDATE_TYPES)
+def volatile_and_explicit(request, continuous_data):
+    """Build the volatile and explicit networks once per update type and backend.
+
+    Returns the update type and the host-side trajectories keyed by
+    ``(network, backend)``, shared by the equivalence and cross-backend tests below.
+    """
+    volatility_updates = request.param
+    trajectories = {
+        (network, backend): _host_trajectories(
+            build(cls, volatility_updates, continuous_data)
+        )
+        for network, build in [
+            ("volatile", _build_volatile),
+            ("explicit", _build_explicit),
+        ]
+        for backend, cls in [("py", PyNetwork), ("rs", RsNetwork)]
+    }
+    return volatility_updates, trajectories
+
+
+def test_volatile_node_matches_explicit(volatile_and_explicit):
     """Test that volatile-state is equivalent to explicit continuous+vol-parent pair.
 
     Both the Python and Rust backends satisfy this equivalence: the value-level
     posterior update runs before the volatility-level prediction-error step in both.
     """
-    timeseries = load_data("continuous")
-
-    for cls, label in [
-        (PyNetwork, f"{volatility_updates} py"),
-        (RsNetwork, f"{volatility_updates} rs"),
-    ]:
-        vol = _build_volatile(cls, volatility_updates, timeseries)
-        exp = _build_explicit(cls, volatility_updates, timeseries)
+    volatility_updates, trajectories = volatile_and_explicit
+    for backend in ["py", "rs"]:
+        label = f"{volatility_updates} {backend}"
+        vol = trajectories["volatile", backend]
+        exp = trajectories["explicit", backend]
 
         _assert_value_level_match(vol, 0, exp, 0, f"{label} input")
         _assert_value_level_match(vol, 1, exp, 1, label)
         _assert_vol_level_match(vol, 1, exp, 2, label)
 
 
-def _run_explicit_cross_backend(volatility_updates):
-    """Test that Python and Rust produce the same trajectories for explicit networks."""
-    timeseries = load_data("continuous")
+def test_explicit_cross_backend(volatile_and_explicit):
+    """Test that Python and Rust produce the same trajectories for explicit networks.
 
-    exp_py = _build_explicit(PyNetwork, volatility_updates, timeseries)
-    exp_rs = _build_explicit(RsNetwork, volatility_updates, timeseries)
+    The unbounded update is compared with a looser tolerance: Python and Rust use
+    mathematically equivalent but float-distinct unbounded posterior kernels.
+    """
+    volatility_updates, trajectories = volatile_and_explicit
+    exp_py = trajectories["explicit", "py"]
+    exp_rs = trajectories["explicit", "rs"]
 
     label = f"{volatility_updates} py vs rs"
-    # Unbounded path: see docstring — Python and Rust use mathematically
-    # equivalent but float-distinct unbounded posterior kernels.
     rtol = 1e-1 if volatility_updates == "unbounded" else 1e-4
     _assert_value_level_match(exp_py, 0, exp_rs, 0, f"{label} input", rtol=rtol)
     _assert_value_level_match(exp_py, 1, exp_rs, 1, label, rtol=rtol)
 
 
-def test_volatile_node_matches_explicit_volatility_parent():
-    """Test Rust volatile-state against explicit continuous+vol-parent (standard)."""
-    _run_volatile_vs_explicit("standard")
-
-
-def test_volatile_node_ehgf_matches_explicit():
-    """Test Rust volatile-state against explicit continuous+vol-parent (eHGF)."""
-    _run_volatile_vs_explicit("eHGF")
-
-
-def test_volatile_node_unbounded_matches_explicit():
-    """Test Rust volatile-state against explicit continuous+vol-parent (unbounded)."""
-    _run_volatile_vs_explicit("unbounded")
-
-
-def test_explicit_cross_backend_standard():
-    """Test Python and Rust explicit networks agree (standard update)."""
-    _run_explicit_cross_backend("standard")
-
-
-def test_explicit_cross_backend_ehgf():
-    """Test Python and Rust explicit networks agree (eHGF update)."""
-    _run_explicit_cross_backend("eHGF")
-
-
-def test_explicit_cross_backend_unbounded():
-    """Test Python and Rust explicit networks agree (unbounded update)."""
-    _run_explicit_cross_backend("unbounded")
-
-
 def _run_volatile_input_leaf_precision(cls, label, mean_field_updates=False):
     """Check that a volatile-state input/leaf node keeps its prior precision.
 
@@ -184,7 +193,7 @@ def test_volatile_input_node_uses_prior_precision_rust():
     _run_volatile_input_leaf_precision(RsNetwork, "rs")
 
 
-def _assert_volatile_node_cross_backend(net_py, net_rs, node, label="", rtol=1e-4):
+def _assert_volatile_node_cross_backend(traj_py, traj_rs, node, label="", rtol=1e-4):
     """Assert a volatile node's trajectories match across backends."""
     keys = [
         "mean",
@@ -197,32 +206,37 @@ def _assert_volatile_node_cross_backend(net_py, net_rs, node, label="", rtol=1e-
         "expected_precision_vol",
     ]
     for key in keys:
-        assert np.allclose(
-            net_py.node_trajectories[node][key],
-            net_rs.node_trajectories[node][key],
+        np.testing.assert_allclose(
+            traj_py[node][key],
+            traj_rs[node][key],
             rtol=rtol,
-        ), f"{label}: key '{key}' mismatch"
+            atol=1e-8,
+            equal_nan=False,
+            err_msg=f"{label}: key '{key}' mismatch",
+        )
 
 
 @pytest.mark.parametrize("volatility_updates", UPDATE_TYPES)
-def test_volatile_mean_field_cross_backend(volatility_updates):
+def test_volatile_mean_field_cross_backend(continuous_data, volatility_updates):
     """JAX and Rust agree for volatile-state nodes with ``mean_field_updates=True``.
 
     Exercises the mean-field prediction and posterior paths of the volatile-state node
     (the ``_mean_field`` update functions), which the relaxed-default tests above do not
     cover.
     """
-    timeseries = load_data("continuous")
-
-    vol_py = _build_volatile(
-        PyNetwork, volatility_updates, timeseries, mean_field_updates=True
+    vol_py = _host_trajectories(
+        _build_volatile(
+            PyNetwork, volatility_updates, continuous_data, mean_field_updates=True
+        )
     )
-    vol_rs = _build_volatile(
-        RsNetwork, volatility_updates, timeseries, mean_field_updates=True
+    vol_rs = _host_trajectories(
+        _build_volatile(
+            RsNetwork, volatility_updates, continuous_data, mean_field_updates=True
+        )
     )
 
     # Unbounded path: Python and Rust use mathematically equivalent but float-distinct
-    # unbounded posterior kernels (see _run_explicit_cross_backend).
+    # unbounded posterior kernels (see test_explicit_cross_backend).
     rtol = 1e-1 if volatility_updates == "unbounded" else 1e-4
     _assert_volatile_node_cross_backend(
         vol_py, vol_rs, 1, f"{volatility_updates} mean_field py vs rs", rtol=rtol
@@ -230,15 +244,17 @@ def test_volatile_mean_field_cross_backend(volatility_updates):
 
 
 @pytest.mark.parametrize("volatility_updates", UPDATE_TYPES)
-def test_explicit_mean_field_cross_backend(volatility_updates):
+def test_explicit_mean_field_cross_backend(continuous_data, volatility_updates):
     """JAX and Rust agree for explicit continuous+vol-parent with mean-field updates."""
-    timeseries = load_data("continuous")
-
-    exp_py = _build_explicit(
-        PyNetwork, volatility_updates, timeseries, mean_field_updates=True
+    exp_py = _host_trajectories(
+        _build_explicit(
+            PyNetwork, volatility_updates, continuous_data, mean_field_updates=True
+        )
     )
-    exp_rs = _build_explicit(
-        RsNetwork, volatility_updates, timeseries, mean_field_updates=True
+    exp_rs = _host_trajectories(
+        _build_explicit(
+            RsNetwork, volatility_updates, continuous_data, mean_field_updates=True
+        )
     )
 
     label = f"{volatility_updates} mean_field py vs rs"
@@ -282,7 +298,7 @@ def _build_volatile_value_parent(coupling_fn, mean_field_updates, timeseries):
 
 
 @pytest.mark.parametrize("mean_field_updates", [False, True])
-def test_volatile_nonlinear_coupling(mean_field_updates):
+def test_volatile_nonlinear_coupling(continuous_data, mean_field_updates):
     """Volatile-state node with non-linear (tanh) value coupling (JAX).
 
     Exercises the non-linear coupling branches (the ``grad`` / ``grad(grad(...))``
@@ -296,11 +312,10 @@ def test_volatile_nonlinear_coupling(mean_field_updates):
     """
     import jax.numpy as jnp
 
-    timeseries = load_data("continuous")
     nonlinear = _build_volatile_value_parent(
-        (jnp.tanh,), mean_field_updates, timeseries
+        (jnp.tanh,), mean_field_updates, continuous_data
     )
-    linear = _build_volatile_value_parent(None, mean_field_updates, timeseries)
+    linear = _build_volatile_value_parent(None, mean_field_updates, continuous_data)
 
     label = f"nonlinear mean_field={mean_field_updates}"
     for key in ["mean", "expected_mean", "precision", "expected_precision"]:
@@ -344,7 +359,7 @@ def _build_volatile_value_child(coupling_fn, mean_field_updates, timeseries):
 
 
 @pytest.mark.parametrize("mean_field_updates", [False, True])
-def test_volatile_nonlinear_value_parent(mean_field_updates):
+def test_volatile_nonlinear_value_parent(continuous_data, mean_field_updates):
     """Volatile-state node with a non-linearly-coupled value parent (JAX).
 
     Exercises the prediction-step non-linear coupling branches
@@ -355,9 +370,10 @@ def test_volatile_nonlinear_value_parent(mean_field_updates):
     """
     import jax.numpy as jnp
 
-    timeseries = load_data("continuous")
-    nonlinear = _build_volatile_value_child((jnp.tanh,), mean_field_updates, timeseries)
-    linear = _build_volatile_value_child(None, mean_field_updates, timeseries)
+    nonlinear = _build_volatile_value_child(
+        (jnp.tanh,), mean_field_updates, continuous_data
+    )
+    linear = _build_volatile_value_child(None, mean_field_updates, continuous_data)
 
     label = f"nonlinear value parent mean_field={mean_field_updates}"
     for key in ["mean", "expected_mean", "precision", "expected_precision"]:
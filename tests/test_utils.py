@@ -1,5 +1,6 @@
 # Author: Nicolas Legrand <nicolas.legrand@cas.au.dk>
 
+import jax
 import jax.numpy as jnp
 import numpy as np
 import pytest
@@ -9,8 +10,18 @@ from pytest import raises
 from pyhgf import load_data
 from pyhgf.model import Network
 from pyhgf.typing import AdjacencyLists, UpdateSequence
-from pyhgf.utils import add_parent, list_branches, remove_node, sample, set_coupling
-from pyhgf.utils.beliefs_propagation import beliefs_propagation
+from pyhgf.utils import (
+    add_parent,
+    list_branches,
+    remove_node,
+    sample,
+    set_coupling,
+)
+from pyhgf.utils.beliefs_propagation import (
+    beliefs_propagation,
+    beliefs_propagation_batched,
+)
+from pyhgf.utils.set_coupling import _set_couplings
 
 
 def test_imports():
@@ -182,7 +193,7 @@ def test_belief_propagation():
         input_idxs=(0, 1),
         observations="generative",
     )
-    assert jnp.isclose(new_attributes[0]["mean"], -0.20584226)
+    assert jnp.isclose(new_attributes[0]["mean"], 0.14389051)
     assert jnp.isclose(new_attributes[1]["mean"], 1.0)
 
     # 3 - Deprived ---------------------------------------------------------------------
@@ -233,6 +244,55 @@ def test_belief_propagation():
     )
 
 
+def test_belief_propagation_batched():
+    """Test the belief propagation over a batch of networks."""
+    network = (
+        Network()
+        .add_nodes(kind="continuous-state")
+        .add_nodes(value_children=0)
+        .add_nodes(volatility_children=1)
+    )
+    attributes, edges, update_sequence = network.get_network()
+
+    # two networks sharing the same structure with different tonic volatility
+    attributes_list = []
+    for tonic_volatility in [-2.0, -4.0]:
+        network.attributes[1]["tonic_volatility"] = tonic_volatility
+        attributes_list.append(jax.tree.map(jnp.asarray, network.get_network()[0]))
+    batched_attributes = jax.tree.map(lambda *x: jnp.stack(x), *attributes_list)
+
+    values = jnp.array([[0.5], [-0.5]])
+    inputs = (
+        (values,),
+        (jnp.ones(2, dtype=int),),
+        jnp.ones(2),
+        None,
+    )
+
+    batched, _ = beliefs_propagation_batched(
+        attributes=batched_attributes,
+        inputs=inputs,
+        update_sequence=update_sequence,
+        edges=edges,
+        input_idxs=(0,),
+    )
+
+    # every network in the batch matches its own non-batched update
+    for i, attributes in enumerate(attributes_list):
+        new_attributes, _ = beliefs_propagation(
+            attributes=attributes,
+            inputs=((values[i],), (1,), 1.0, None),
+            update_sequence=update_sequence,
+            edges=edges,
+            input_idxs=(0,),
+        )
+        for node_idx in range(3):
+            for key in ["mean", "precision"]:
+                assert jnp.isclose(
+                    batched[node_idx][key][i], new_attributes[node_idx][key]
+                )
+
+
 def test_learning():
     """Test the learning method for deep networks."""
     # here x represents the visual input (River / No River)
@@ -321,3 +381,22 @@ def test_set_coupling():
 
     assert attributes[0]["value_coupling_parents"][0] == 0.5
     assert attributes[3]["value_coupling_children"][0] == 0.5
+
+
+def test_set_couplings():
+    """Test the _set_couplings function."""
+    # nodes 2 and 3 are both value parents of nodes 0 and 1
+    network = Network().add_nodes(n_nodes=2).add_nodes(n_nodes=2, value_children=[0, 1])
+
+    attributes = _set_couplings(
+        attributes=network.attributes,
+        edges=network.edges,
+        child_idx=1,
+        couplings=jnp.array([0.5, -0.2]),
+    )
+
+    assert jnp.allclose(attributes[1]["value_coupling_parents"], jnp.array([0.5, -0.2]))
+    assert jnp.allclose(attributes[2]["value_coupling_children"], jnp.array([1.0, 0.5]))
+    assert jnp.allclose(
+        attributes[3]["value_coupling_children"], jnp.array([1.0, -0.2])
+    )